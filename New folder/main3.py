@@ -3,10 +3,89 @@ from tkinter import ttk, messagebox, filedialog
 import json
 import csv
 import os
+import re
+import shutil
+import threading
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Union
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+    try:
+        ijson = ijson.get_backend('yajl2_c')  # C backend when built
+    except (ImportError, AttributeError):
+        pass  # Not built, or an ijson release without get_backend
+except ImportError:
+    ijson = None
+
+
+# Buffer size for library file I/O; large files need far fewer syscalls than with 8 KiB
+IO_BUFFER_SIZE = 1 << 20
+
+# Column order of library CSV files
+CSV_FIELDS = ['title', 'author', 'genre', 'year']
+
+
+def _json_dumps(data, indent: bool = False) -> bytes:
+    """Serialize data to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+
+def _json_loads(raw: bytes):
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _iter_json_items(f):
+    """Iterate the items of a top-level JSON array from a binary file.
+
+    With ijson the array is streamed one item at a time, so the whole parsed
+    document never has to be held in memory at once.
+    """
+    if ijson is not None:
+        return ijson.items(f, 'item')
+    return iter(_json_loads(f.read()))
+
+
+def _iter_csv_rows(f):
+    """Iterate (title, author, genre, year) tuples from a library CSV file.
+
+    Columns are located by the header once, so files with another column
+    order or extra columns still load; blank rows are skipped.
+    """
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is None:
+        return
+    missing = [name for name in CSV_FIELDS if name not in header]
+    if missing:
+        raise ValueError(f"CSV header is missing column(s): {', '.join(missing)}")
+    t, a, g, y = (header.index(name) for name in CSV_FIELDS)
+    for row in reader:
+        if row:
+            yield row[t], row[a], row[g], int(row[y])
+
+
+def _make_search_blob(title: str, author: str, genre: str) -> str:
+    """Lowercased searchable fields, NUL-separated so matches cannot span two fields"""
+    return (title + "\x00" + author + "\x00" + genre).lower()
+
 
 class Book:
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ('title', 'author', 'genre', 'year')
+
     def __init__(self, title: str, author: str, genre: str, year: int):
         self.title = title
         self.author = author
@@ -22,52 +101,192 @@ class Book:
             'year': self.year
         }
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Union[str, int]]):
-        """Create Book instance from dictionary"""
-        return cls(data['title'], data['author'], data['genre'], data['year'])
 
 class Library:
     def __init__(self):
-        self.books: List[Book] = []
+        # Books are stored column-wise: one list per field, aligned by position
+        self.titles: List[str] = []
+        self.authors: List[str] = []
+        self.genres: List[str] = []
+        self.years = array('h')  # int16: 2 bytes per year instead of a full int object
+        self._blob_list: List[str] = []  # Lowercased search text per book
         self.json_filename = "library_data.json"
         self.csv_filename = "library_data.csv"
+        self.journal_filename = "library_data.jsonl"
+        # Journal moved aside while a save is writing the JSON file, then renamed
+        # to .applied once the new JSON file holds its books
+        self.pending_journal_filename = self.journal_filename + ".pending"
+        self.applied_journal_filename = self.journal_filename + ".applied"
+        self._dirty = False  # True while the journal holds books not yet in the JSON file
+        # JSON saves run on a single background thread; the lock guards the columns
+        # and journal files against it. Only the UI thread mutates the columns.
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._io_lock = threading.Lock()
+        self._save_future = None  # Outstanding background save, if any
+        self._save_requested = False  # A save was asked for since the worker last snapshotted
+        self._save_error = None  # Last background save failure, reported on the UI thread
+        # Lowercased title -> ids of the books with that title, oldest first. Ids,
+        # unlike positions, stay valid when an earlier book is removed.
+        self._by_title_lower: Dict[str, List[int]] = {}
+        self._ids: List[int] = []  # Id of each book, aligned with the columns
+        self._next_id = 0
+        # Bumped on every change to the columns, which also empties the search cache
+        self._version = 0
+        self._cached_search = lru_cache(maxsize=256)(self._scan)
         self.load_library()  # Load data on initialization
+        self._index_titles(0)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    @property
+    def books(self) -> List[Book]:
+        """Book views over the stored columns"""
+        return self._book_views(self.rows())
+
+    def rows(self, indices: List[int] = None):
+        """Iterate (title, author, genre, year) tuples, optionally for selected positions"""
+        if indices is None:
+            return zip(self.titles, self.authors, self.genres, self.years)
+        titles, authors, genres, years = self.titles, self.authors, self.genres, self.years
+        return ((titles[i], authors[i], genres[i], years[i]) for i in indices)
+
+    @staticmethod
+    def _book_views(rows) -> List[Book]:
+        """Internal method to build Book views from (title, author, genre, year) rows"""
+        B = Book
+        return [B(t, a, g, y) for t, a, g, y in rows]
+
+    @staticmethod
+    def _build_columns(rows):
+        """Internal method to turn (title, author, genre, year) rows into new columns.
+
+        Raises before anything is stored if any row is invalid, e.g. a year
+        outside the int16 range.
+        """
+        # One pass over rows, so a streamed source is never held in memory whole
+        titles, authors, genres, blobs = [], [], [], []
+        years = array('h')
+        for title, author, genre, year in rows:
+            years.append(year)
+            titles.append(title)
+            authors.append(author)
+            genres.append(genre)
+            blobs.append(_make_search_blob(title, author, genre))
+        return titles, authors, genres, years, blobs
+
+    def _replace(self, rows) -> None:
+        """Internal method to replace all stored books; unchanged if a row is invalid"""
+        titles, authors, genres, years, blobs = self._build_columns(rows)
+        with self._io_lock:
+            self.titles, self.authors, self.genres, self.years = titles, authors, genres, years
+            self._blob_list = blobs
+            self._ids = self._new_ids(len(titles))
+            self._bump_version()
+
+    def _extend(self, rows) -> None:
+        """Internal method to append rows to the columns; unchanged if a row is invalid"""
+        titles, authors, genres, years, blobs = self._build_columns(rows)
+        with self._io_lock:
+            self.titles.extend(titles)
+            self.authors.extend(authors)
+            self.genres.extend(genres)
+            self.years.extend(years)
+            self._blob_list.extend(blobs)
+            self._ids.extend(self._new_ids(len(titles)))
+            self._bump_version()
+
+    def _bump_version(self) -> None:
+        """Internal method to mark the columns changed and drop stale search results"""
+        self._version += 1
+        self._cached_search.cache_clear()
+
+    def _new_ids(self, count: int) -> List[int]:
+        """Internal method to allocate ids for count new books"""
+        start = self._next_id
+        self._next_id += count
+        return list(range(start, self._next_id))
+
+    def _index_titles(self, start: int) -> None:
+        """Add books from position start onwards to the title index"""
+        index = self._by_title_lower
+        titles, ids = self.titles, self._ids
+        for i in range(start, len(titles)):
+            index.setdefault(titles[i].lower(), []).append(ids[i])
 
     def add_book(self, book: Book) -> None:
-        """Add a book to the library"""
-        self.books.append(book)
-        self.save_library()
+        """Add a book to the library (appended to the journal until the next flush)"""
+        self._extend([(book.title, book.author, book.genre, book.year)])
+        self._index_titles(len(self) - 1)
+        try:
+            self._append_to_journal(book)
+        except Exception as e:
+            # The book is only in memory now; make the next flush rewrite the file
+            self._dirty = True
+            messagebox.showerror("Error", f"Failed to save book: {str(e)}")
 
     def remove_book(self, title: str) -> bool:
         """Remove a book by title"""
-        for i, book in enumerate(self.books):
-            if book.title.lower() == title.lower():
-                del self.books[i]
-                self.save_library()
-                return True
-        return False
+        key = title.lower()
+        ids = self._by_title_lower.get(key)
+        if not ids:
+            return False
+        book_id = ids.pop(0)
+        if not ids:
+            del self._by_title_lower[key]
+        removed = self._ids.index(book_id)
+        with self._io_lock:
+            for column in (self.titles, self.authors, self.genres, self.years,
+                           self._blob_list, self._ids):
+                del column[removed]
+            self._bump_version()
+        self.save_library()
+        return True
+
+    def search_indices(self, query: str, pattern: re.Pattern = None) -> List[int]:
+        """Positions of books whose title, author, or genre contains the query.
+
+        A precompiled pattern for the lowercased query may be passed to reuse
+        it across repeated searches.
+        """
+        return list(self._cached_search(self._version, query.lower(), pattern))
+
+    def _scan(self, version: int, query: str, pattern: re.Pattern = None) -> tuple:
+        """Internal method to scan the search blobs; memoized per library version"""
+        if pattern is None:
+            return tuple(i for i, blob in enumerate(self._blob_list) if query in blob)
+        match = pattern.search
+        return tuple(i for i, blob in enumerate(self._blob_list) if match(blob))
 
-    def search_books(self, query: str) -> List[Book]:
+    def search_books(self, query: str, pattern: re.Pattern = None) -> List[Book]:
         """Search books by title, author, or genre"""
-        results = []
-        query = query.lower()
-        for book in self.books:
-            if (query in book.title.lower() or
-                    query in book.author.lower() or
-                    query in book.genre.lower()):
-                results.append(book)
-        return results
+        return self._book_views(self.rows(self.search_indices(query, pattern)))
 
     def get_all_books(self) -> List[Book]:
         """Get all books in the library"""
         return self.books
 
+    def _records(self, rows=None) -> List[Dict[str, Union[str, int]]]:
+        """Internal method to build the serializable list of book dictionaries"""
+        if rows is None:
+            rows = self.rows()
+        return [{'title': t, 'author': a, 'genre': g, 'year': y} for t, a, g, y in rows]
+
+    def flush(self) -> bool:
+        """Write pending changes to the JSON file and wait until it is on disk"""
+        if self._dirty:
+            self._schedule_save()
+        future = self._save_future
+        if future is not None:
+            future.result()
+        return self._report_save_error()
+
     def save_library(self, format: str = 'json') -> bool:
-        """Save library to file (default: JSON)"""
+        """Save library to file (default: JSON, written in the background)"""
         try:
             if format == 'json':
-                return self._save_to_json()
+                self._schedule_save()
+                return self._report_save_error()
             elif format == 'csv':
                 return self._save_to_csv()
             return False
@@ -75,23 +294,108 @@ class Library:
             messagebox.showerror("Error", f"Failed to save library: {str(e)}")
             return False
 
+    def _schedule_save(self) -> None:
+        """Internal method to queue a JSON save, coalescing with one already queued"""
+        with self._io_lock:
+            self._save_requested = True
+            if self._save_future is None:
+                self._save_future = self._io_pool.submit(self._save_worker)
+
+    def _save_worker(self) -> None:
+        """Internal method run on the I/O thread; saves until no request is left"""
+        while True:
+            with self._io_lock:
+                if not self._save_requested:
+                    self._save_future = None
+                    return
+                self._save_requested = False
+            try:
+                self._save_to_json()
+            except Exception as e:
+                self._save_error = e
+
+    def _report_save_error(self) -> bool:
+        """Internal method to show a failed background save on the UI thread"""
+        error, self._save_error = self._save_error, None
+        if error is None:
+            return True
+        messagebox.showerror("Error", f"Failed to save library: {str(error)}")
+        return False
+
     def _save_to_json(self) -> bool:
         """Internal method to save to JSON file"""
         try:
-            with open(self.json_filename, 'w') as f:
-                json.dump([book.to_dict() for book in self.books], f, indent=2)
+            with self._io_lock:
+                self._finish_interrupted_save()
+                # Snapshot the columns and move the journal aside together, so books
+                # added while the file is written go to a fresh journal
+                rows = list(zip(self.titles, self.authors, self.genres, self.years))
+                pending = self._rotate_journal()
+                self._dirty = False
+            try:
+                # Write a temporary file and swap it in, so a crash mid-write never
+                # leaves a truncated library behind
+                tmp_filename = self.json_filename + ".tmp"
+                with open(tmp_filename, 'wb', buffering=IO_BUFFER_SIZE) as f:
+                    # Compact output: this file is only read back by the app
+                    f.write(_json_dumps(self._records(rows)))
+                if pending is not None:
+                    # Commit point: from here on the journal must not be replayed,
+                    # and the complete temporary file is rolled forward if needed
+                    os.replace(pending, self.applied_journal_filename)
+                os.replace(tmp_filename, self.json_filename)
+            except Exception:
+                self._dirty = True
+                raise
+            if pending is not None:
+                os.remove(self.applied_journal_filename)
             return True
         except Exception as e:
             raise Exception(f"JSON save error: {str(e)}")
 
+    def _finish_interrupted_save(self) -> None:
+        """Internal method to complete a save that stopped after its commit point.
+
+        An .applied journal means the temporary JSON file was fully written and
+        already holds the journal's books: move it into place if that had not
+        happened yet, and drop the journal instead of replaying it.
+        """
+        if os.path.exists(self.applied_journal_filename):
+            tmp_filename = self.json_filename + ".tmp"
+            if os.path.exists(tmp_filename):
+                os.replace(tmp_filename, self.json_filename)
+            os.remove(self.applied_journal_filename)
+
+    def _rotate_journal(self):
+        """Internal method to move the journal aside; returns the moved file, if any"""
+        pending = self.pending_journal_filename
+        if os.path.exists(self.journal_filename):
+            if os.path.exists(pending):
+                # An earlier save failed; keep its entries alongside the new ones
+                with open(pending, 'ab') as dst, open(self.journal_filename, 'rb') as src:
+                    shutil.copyfileobj(src, dst)
+                os.remove(self.journal_filename)
+            else:
+                os.replace(self.journal_filename, pending)
+        return pending if os.path.exists(pending) else None
+
+    def _append_to_journal(self, book: Book) -> None:
+        """Internal method to append a single book to the journal file"""
+        try:
+            with self._io_lock:
+                with open(self.journal_filename, 'ab') as f:
+                    f.write(_json_dumps(book.to_dict()) + b"\n")
+                self._dirty = True
+        except Exception as e:
+            raise Exception(f"Journal save error: {str(e)}")
+
     def _save_to_csv(self) -> bool:
         """Internal method to save to CSV file"""
         try:
-            with open(self.csv_filename, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=['title', 'author', 'genre', 'year'])
-                writer.writeheader()
-                for book in self.books:
-                    writer.writerow(book.to_dict())
+            with open(self.csv_filename, 'w', buffering=IO_BUFFER_SIZE, newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(CSV_FIELDS)
+                writer.writerows(self.rows())
             return True
         except Exception as e:
             raise Exception(f"CSV save error: {str(e)}")
@@ -99,11 +403,21 @@ class Library:
     def load_library(self) -> bool:
         """Load library from available files (JSON preferred)"""
         try:
+            self._finish_interrupted_save()
+            loaded = False
             if os.path.exists(self.json_filename):
-                return self._load_from_json()
+                loaded = self._load_from_json()
             elif os.path.exists(self.csv_filename):
-                return self._load_from_csv()
-            return False
+                loaded = self._load_from_csv()
+            torn = False
+            for journal in (self.pending_journal_filename, self.journal_filename):
+                if os.path.exists(journal):
+                    torn = self._load_from_journal(journal) or torn
+                    loaded = True
+            if torn:
+                # Compact now so new entries are not appended after a damaged line
+                self._save_to_json()
+            return loaded
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load library: {str(e)}")
             return False
@@ -111,9 +425,9 @@ class Library:
     def _load_from_json(self) -> bool:
         """Internal method to load from JSON file"""
         try:
-            with open(self.json_filename, 'r') as f:
-                data = json.load(f)
-                self.books = [Book.from_dict(book_data) for book_data in data]
+            with open(self.json_filename, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                self._replace((d['title'], d['author'], d['genre'], d['year'])
+                              for d in _iter_json_items(f))
             return True
         except Exception as e:
             raise Exception(f"JSON load error: {str(e)}")
@@ -121,52 +435,93 @@ class Library:
     def _load_from_csv(self) -> bool:
         """Internal method to load from CSV file"""
         try:
-            with open(self.csv_filename, 'r', newline='') as f:
-                reader = csv.DictReader(f)
-                self.books = [Book(row['title'], row['author'], row['genre'], int(row['year']))
-                              for row in reader]
+            with open(self.csv_filename, 'r', buffering=IO_BUFFER_SIZE, newline='') as f:
+                self._replace(_iter_csv_rows(f))
             return True
         except Exception as e:
             raise Exception(f"CSV load error: {str(e)}")
 
+    def _load_from_journal(self, filename: str) -> bool:
+        """Internal method to replay books appended since the last full save.
+
+        Returns True if a damaged line had to be skipped.
+        """
+        try:
+            torn = False
+            rows = []
+            with open(filename, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        d = _json_loads(line)
+                    except ValueError:
+                        torn = True  # Partial write from an interrupted session
+                        continue
+                    rows.append((d['title'], d['author'], d['genre'], d['year']))
+            self._extend(rows)
+            self._dirty = True
+            return torn
+        except Exception as e:
+            raise Exception(f"Journal load error: {str(e)}")
+
     def export_library(self, filename: str, format: str = 'json') -> bool:
         """Export library to specified file"""
         try:
-            if format == 'json':
-                with open(filename, 'w') as f:
-                    json.dump([book.to_dict() for book in self.books], f, indent=2)
-                return True
-            elif format == 'csv':
-                with open(filename, 'w', newline='') as f:
-                    writer = csv.DictWriter(f, fieldnames=['title', 'author', 'genre', 'year'])
-                    writer.writeheader()
-                    for book in self.books:
-                        writer.writerow(book.to_dict())
-                return True
-            return False
+            return self._export_to_file(filename, format, self.rows())
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export library: {str(e)}")
             return False
 
+    def export_in_background(self, filename: str, format: str = 'json') -> Future:
+        """Export a snapshot of the library on the I/O thread.
+
+        Pending changes are queued for saving first. The returned Future
+        resolves to export_library's result or raises its error; the caller
+        reports it on the UI thread.
+        """
+        with self._io_lock:
+            rows = list(zip(self.titles, self.authors, self.genres, self.years))
+        if self._dirty:
+            self._schedule_save()
+        return self._io_pool.submit(self._export_to_file, filename, format, rows)
+
+    def _export_to_file(self, filename: str, format: str, rows) -> bool:
+        """Internal method to write (title, author, genre, year) rows to an export file"""
+        if format == 'json':
+            with open(filename, 'wb', buffering=IO_BUFFER_SIZE) as f:
+                f.write(_json_dumps(self._records(rows), indent=True))
+            return True
+        elif format == 'csv':
+            with open(filename, 'w', buffering=IO_BUFFER_SIZE, newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(CSV_FIELDS)
+                writer.writerows(rows)
+            return True
+        return False
+
     def import_library(self, filename: str) -> bool:
         """Import library from specified file"""
         try:
-            temp_books = []
+            rows = []
             if filename.endswith('.json'):
-                with open(filename, 'r') as f:
-                    data = json.load(f)
-                    temp_books = [Book.from_dict(book_data) for book_data in data]
+                with open(filename, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                    rows = [(d['title'], d['author'], d['genre'], d['year'])
+                            for d in _iter_json_items(f)]
             elif filename.endswith('.csv'):
-                with open(filename, 'r', newline='') as f:
-                    reader = csv.DictReader(f)
-                    temp_books = [Book(row['title'], row['author'], row['genre'], int(row['year']))
-                                  for row in reader]
+                with open(filename, 'r', buffering=IO_BUFFER_SIZE, newline='') as f:
+                    rows = list(_iter_csv_rows(f))
             else:
                 messagebox.showerror("Error", "Unsupported file format")
                 return False
 
-            self.books.extend(temp_books)
-            self.save_library()
+            start = len(self)
+            self._extend(rows)
+            self._index_titles(start)
+            # Leave the rewrite to the background writer; flush() waits for it
+            self._dirty = True
+            self._schedule_save()
             return True
         except Exception as e:
             messagebox.showerror("Error", f"Failed to import library: {str(e)}")
@@ -174,9 +529,21 @@ class Library:
 
 
 class LibraryApp:
+    # Status bar templates, bound once instead of formatted from scratch per refresh
+    _FILTERED_FMT = "Showing {0} of {1} books (filtered)".format
+    _ALL_FMT = "Showing all {0} books".format
+
     def __init__(self, root):
         self.root = root
         self.library = Library()
+        # Compiled patterns for recent search queries, keyed by lowercased query
+        self._search_cache: Dict[str, re.Pattern] = {}
+        self._pending_search = None  # after() id of the debounced search, if scheduled
+        self._search_text = ''  # Search box text when a search was last scheduled
+        # Windowed book list: only the rows that fit in the tree are inserted
+        self._view_indices = None  # Positions being listed, or None for all books
+        self._view_start = 0  # Offset of the first displayed row within the listing
+        self._view_selected = None  # Listing offset of the selected book, if any
 
         # Configure style
         self.style = ttk.Style()
@@ -186,6 +553,14 @@ class LibraryApp:
         self.setup_ui()
         self.update_book_list()
 
+        # Write pending journal entries back to the JSON file on exit
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self) -> None:
+        """Flush the library to disk and close the window"""
+        self.library.flush()
+        self.root.destroy()
+
     def configure_styles(self):
         """Configure the visual styles for the application"""
         # Color scheme
@@ -284,10 +659,19 @@ class LibraryApp:
         self.tree.column('Year', width=80, anchor=tk.W)
         self.tree.pack(fill=tk.BOTH, expand=True)
 
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(self.tree, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscroll=scrollbar.set)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Scrollbar: drives the windowed view instead of the tree's own scrolling
+        self.scrollbar = ttk.Scrollbar(self.tree, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Rows scrolled into view by the tree itself (e.g. clicking a partly
+        # visible last row) are handed over to the windowed view
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll)
+        self.tree.bind('<<TreeviewSelect>>', self._on_tree_select)
+        for key in ('<Up>', '<Down>', '<Prior>', '<Next>', '<Home>', '<End>'):
+            self.tree.bind(key, self._on_tree_key)
+        self.tree.bind('<Configure>', self._on_tree_resize)
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', self._on_mousewheel)
+        self.tree.bind('<Button-5>', self._on_mousewheel)
 
         # Search Section
         self.search_frame = ttk.LabelFrame(self.control_frame,
@@ -297,6 +681,7 @@ class LibraryApp:
 
         self.search_entry = ttk.Entry(self.search_frame, font=('Helvetica', 10))
         self.search_entry.pack(fill=tk.X, padx=5, pady=(0, 5))
+        self.search_entry.bind('<KeyRelease>', self._on_search_change)
 
         self.search_button = ttk.Button(self.search_frame,
                                         text="Search",
@@ -378,26 +763,186 @@ class LibraryApp:
                                       anchor=tk.W)
         self.status_label.pack(fill=tk.X, padx=5)
 
-    def update_book_list(self, books: List[Book] = None) -> None:
-        """Update the book list display"""
-        self.tree.delete(*self.tree.get_children())
-        books_to_show = books if books is not None else self.library.get_all_books()
-        for book in books_to_show:
-            self.tree.insert('', tk.END, values=(book.title, book.author, book.genre, book.year))
-
-        count = len(books_to_show)
-        total = len(self.library.books)
-        if books is not None:
-            self.status_label.config(text=f"Showing {count} of {total} books (filtered)")
+    def update_book_list(self, indices: List[int] = None) -> None:
+        """Update the book list display, optionally showing only the given positions"""
+        self._cancel_pending_search()
+        self._view_indices = indices
+        self._view_start = 0
+        self._view_selected = None
+        self._render_view()
+
+        total = len(self.library)
+        if indices is not None:
+            self.status_label.config(text=self._FILTERED_FMT(len(indices), total))
         else:
-            self.status_label.config(text=f"Showing all {count} books")
+            self.status_label.config(text=self._ALL_FMT(total))
+
+    def _view_count(self) -> int:
+        """Number of books in the current listing"""
+        if self._view_indices is not None:
+            return len(self._view_indices)
+        return len(self.library)
+
+    def _page_size(self) -> int:
+        """Number of rows that fit in the book list"""
+        height = self.tree.winfo_height()
+        if height <= 1:
+            return 50  # Not laid out yet
+        row_height = int(self.style.lookup('Treeview', 'rowheight') or 25)
+        return max(1, height // row_height - 1)  # One row's worth for the headings
+
+    def _render_view(self) -> None:
+        """Show the rows of the current listing that fall inside the viewport"""
+        count = self._view_count()
+        page = self._page_size()
+        start = self._view_start = max(0, min(self._view_start, count - page))
+        stop = min(start + page, count)
+        if self._view_indices is None:
+            rows = self.library.rows(range(start, stop))
+        else:
+            rows = self.library.rows(self._view_indices[start:stop])
+
+        # Reuse the existing items, only adding or deleting the difference
+        tree = self.tree
+        children = tree.get_children()
+        item, insert, end = tree.item, tree.insert, tk.END
+        shown = 0
+        for shown, row in enumerate(rows, 1):
+            if shown <= len(children):
+                item(children[shown - 1], values=row)
+            else:
+                insert('', end, values=row)
+        if shown < len(children):
+            tree.delete(*children[shown:])
+        tree.yview_moveto(0)
+
+        # Items are reused, so move the selection to wherever its book now sits
+        selected = self._view_selected
+        if selected is not None and start <= selected < stop:
+            iid = tree.get_children()[selected - start]
+            if tree.selection() != (iid,):
+                tree.selection_set(iid)
+            tree.focus(iid)
+        elif tree.selection():
+            tree.selection_remove(tree.selection())
+
+        if count:
+            self.scrollbar.set(start / count, stop / count)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _scroll_to(self, start: int) -> None:
+        """Move the viewport so the listing's row at start is at the top"""
+        if start != self._view_start:
+            self._view_start = start
+            self._render_view()
+
+    def _on_scrollbar(self, *args) -> None:
+        """Scrollbar command: 'moveto' fraction or 'scroll' count units/pages"""
+        if args[0] == 'moveto':
+            self._scroll_to(int(float(args[1]) * self._view_count()))
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= self._page_size()
+            self._scroll_to(max(0, self._view_start + step))
+
+    def _on_mousewheel(self, event) -> str:
+        """Scroll the windowed view three rows per wheel notch"""
+        if event.num == 4:
+            notches = -1
+        elif event.num == 5:
+            notches = 1
+        else:
+            notches = -event.delta // 120 if abs(event.delta) >= 120 else -event.delta
+        self._scroll_to(max(0, self._view_start + 3 * notches))
+        return 'break'
+
+    def _on_tree_select(self, event=None) -> None:
+        """Remember which book of the listing the user selected"""
+        selection = self.tree.selection()
+        if selection:
+            self._view_selected = self._view_start + self.tree.index(selection[0])
+
+    def _on_tree_key(self, event) -> str:
+        """Move the selection through the whole listing, scrolling the window"""
+        count = self._view_count()
+        if not count:
+            return 'break'
+        page = self._page_size()
+        current = self._view_selected
+        if event.keysym == 'Home':
+            target = 0
+        elif event.keysym == 'End':
+            target = count - 1
+        elif current is None:
+            target = self._view_start
+        else:
+            step = {'Up': -1, 'Down': 1, 'Prior': -page, 'Next': page}[event.keysym]
+            target = current + step
+        target = max(0, min(target, count - 1))
+
+        start = self._view_start
+        if target < start:
+            start = target
+        elif target >= start + page:
+            start = target - page + 1
+        self._view_selected = target
+        if start != self._view_start:
+            self._scroll_to(start)
+        else:
+            self._render_view()
+        return 'break'
+
+    def _on_tree_yscroll(self, first, last) -> None:
+        """Turn an internal scroll of the tree into a move of the window"""
+        hidden = round(float(first) * len(self.tree.get_children()))
+        if hidden:
+            self.tree.yview_moveto(0)
+            self._scroll_to(self._view_start + hidden)
+
+    def _on_tree_resize(self, event=None) -> None:
+        """Refill the book list when the number of rows that fit changes"""
+        if len(self.tree.get_children()) != min(self._page_size(), self._view_count()):
+            self._render_view()
+
+    def _on_search_change(self, event=None) -> None:
+        """Run the search 200 ms after typing stops, if the text actually changed"""
+        text = self.search_entry.get()
+        if text == self._search_text:
+            return  # Modifier, arrow or Tab key: keep the current view
+        self._search_text = text
+        self._cancel_pending_search()
+        self._pending_search = self.root.after(200, self._run_pending_search)
+
+    def _cancel_pending_search(self) -> None:
+        """Drop a debounced search that has not fired yet"""
+        if self._pending_search is not None:
+            self.root.after_cancel(self._pending_search)
+            self._pending_search = None
+
+    def _run_pending_search(self) -> None:
+        """Run the debounced search; an emptied search box shows all books again"""
+        self._pending_search = None
+        if self.search_entry.get():
+            self.search_books()
+        else:
+            self.update_book_list()
 
     def search_books(self) -> None:
         """Search books based on user query"""
+        self._cancel_pending_search()
         query = self.search_entry.get()
+        self._search_text = query
         if query:
-            results = self.library.search_books(query)
-            self.update_book_list(results)
+            key = query.lower()
+            pattern = self._search_cache.get(key)
+            if pattern is None:
+                if len(self._search_cache) >= 256:
+                    self._search_cache.clear()
+                # Search blobs are already lowercased, so no IGNORECASE is needed
+                pattern = self._search_cache[key] = re.compile(re.escape(key))
+            self.update_book_list(self.library.search_indices(query, pattern))
 
     def add_book(self) -> None:
         """Add a new book to the library"""
@@ -453,8 +998,21 @@ class LibraryApp:
         )
         if file_path:
             format = 'json' if file_path.endswith('.json') else 'csv'
-            if self.library.export_library(file_path, format):
-                messagebox.showinfo("Success", "Library exported successfully!")
+            future = self.library.export_in_background(file_path, format)
+            self.export_button.state(['disabled'])
+            self.root.after(100, self._poll_export, future)
+
+    def _poll_export(self, future: Future) -> None:
+        """Report a background export once it has finished"""
+        if not future.done():
+            self.root.after(100, self._poll_export, future)
+            return
+        self.export_button.state(['!disabled'])
+        error = future.exception()
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to export library: {str(error)}")
+        elif future.result():
+            messagebox.showinfo("Success", "Library exported successfully!")
 
     def import_library(self) -> None:
         """Import books from a file"""